@@ -38,6 +38,9 @@ Examples:
   
   # Verbose output showing detailed cleaning process
   python3 clean_markdown.py /path/to/docs --verbose
+  
+  # Limit directory cleaning to 2 worker processes
+  python3 clean_markdown.py /path/to/docs --jobs 2
 
 Common escaped patterns that will be cleaned:
   \\# Header          → # Header
@@ -53,16 +56,27 @@ Common escaped patterns that will be cleaned:
                        help='Preview changes without modifying files')
     parser.add_argument('--verbose', action='store_true',
                        help='Show detailed cleaning process')
+    parser.add_argument('--jobs', type=int, default=None, metavar='N',
+                       help='Number of worker processes for directories (default: one per CPU)')
     
     args = parser.parse_args()
     
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    
     # Validate path
     if not os.path.exists(args.path):
         print(f"❌ Path does not exist: {args.path}")
         sys.exit(1)
     
+    # Per-file messages add up to thousands of lines on large trees, so don't
+    # flush a pipe or log file on every one of them (everything is flushed on
+    # exit); a terminal keeps its line buffering so progress shows as it happens
+    if hasattr(sys.stdout, 'reconfigure') and not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Create cleaner and process files
-    cleaner = MarkdownCleaner(dry_run=args.dry_run, verbose=args.verbose)
+    cleaner = MarkdownCleaner(dry_run=args.dry_run, verbose=args.verbose, jobs=args.jobs)
     
     print("🧹 Markdown Escape Character Cleaner")
     print("=" * 50)
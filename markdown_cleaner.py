@@ -11,17 +11,297 @@ and the GUI application (markdown_cleaner_app.py) to ensure consistent cleaning
 
 import re
 import os
+import io
+import mmap
+import stat
+import tempfile
+import contextlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+
+# Heuristic indicators used to decide whether content appears to be escaped.
+# Plain two-character escapes are checked with substring tests, which are much
+# cheaper than running the regex engine for a literal needle.
+_LITERAL_INDICATORS = (
+    '\\#',           # Escaped headers
+    '\\>',           # Escaped blockquotes
+    '\\+',           # Escaped plus signs
+    '\\_',           # Escaped underscores in text
+)
+
+# The rest are compiled once at import time so every call skips the re module's
+# cache lookup. They are compiled without re.DOTALL, so none of them can match
+# across lines. The paired emphasis/link indicators stop scanning at the next
+# opening escape instead of using .*, which would rescan the rest of the line
+# from every unmatched \[ (a later opening escape finds the same closing one)
+_INDICATORS = tuple(re.compile(indicator) for indicator in [
+    r'\\-\s',        # Escaped lists  
+    r'\\\d+\.',      # Escaped numbered lists
+    r'\\\s*$',       # Trailing standalone backslashes
+    r'\\\*(?:(?!\\\*).)*\\\*',   # Escaped emphasis
+    r'\\\[(?:(?!\\\[).)*\\\]',   # Escaped links
+])
+
+# Pattern to match escaped markdown characters
+# Matches: \# \* \- \+ \. \1 \2 etc.
+# Ordered by specificity to avoid conflicts
+# Patterns that must not follow another backslash check that with a lookbehind
+# placed after the escaping backslash, so each pattern starts with a literal and
+# the regex engine can skip straight to the next backslash between matches.
+_PATTERNS = tuple((re.compile(pattern, re.MULTILINE), replacement) for pattern, replacement in [
+    # Headers: \# \## \### etc. (handle escaped consecutive hashes)
+    (r'\\(#{1,6})', r'\1'),
+    
+    # Lists: \- \* \+ at start of line or after whitespace
+    (r'(^|\s)\\([-*+])\s', r'\1\2 '),
+    
+    # Numbered lists: \1. \2. etc. (both at start of line and mid-text)
+    (r'(^|\s)\\(\d+)\.', r'\1\2.'),
+    (r'\\(\d+)\.', r'\1.'),  # Catch remaining escaped numbers with dots
+    
+    # Escaped plus signs: \+1-2 → +1-2
+    (r'\\(\+)', r'\1'),
+    
+    # Escaped underscores in text: project\_system\_instructions → project_system_instructions
+    (r'\\(_)', r'\1'),
+    
+    # Emphasis: \*text\* \_text\_ (but not legitimate double backslashes)
+    (r'\\(?<!\\\\)([*_])', r'\1'),
+    
+    # Inline code: \`code\`
+    (r'\\(?<!\\\\)(`)', r'\1'),
+    
+    # Links: \[text\]\(url\) (but preserve legitimate escapes)
+    (r'\\(?<!\\\\)([\[\]])', r'\1'),
+    (r'\\(?<!\\\\)([()])', r'\1'),
+    
+    # Horizontal rules: \--- \***
+    (r'\\(?<!\\\\)([-*]{3,})', r'\1'),
+    
+    # Blockquotes: \> 
+    (r'(^|\s)\\(>)\s', r'\1\2 '),
+    
+    # Trailing standalone backslashes (common in Google Docs exports)
+    (r'\\\s*$', r''),
+    
+    # Escaped periods in general text (not just numbered lists)
+    (r'\\(?<!\\\\)(\.)', r'\1'),
+])
+
+
+# Single-pass equivalent of _PATTERNS for content without doubled backslashes.
+# Every alternative starts at the escaping backslash, so the scan jumps from one
+# backslash to the next. Without '\\\\' in the content the (?<!\\) guards in
+# _PATTERNS always hold, which lets single-character escapes collapse into the
+# `char` group; hr looks ahead through \* because the sequential passes clean
+# emphasis before horizontal rules. The content is not split into lines first:
+# re.MULTILINE only changes what $ tests at the position it is reached, the list
+# and trailing-backslash alternatives can consume the newline itself, and a
+# Python loop over the lines costs more than this entire scan.
+# Each alternative gives up within the whitespace or digits right after its
+# backslash, so the scan is already linear; a DFA engine such as RE2 would not
+# speed it up, and it lacks the lookarounds this pattern and _INDICATORS rely on.
+_FUSED_PATTERN = re.compile(r"""
+    \\(?:
+         (?<=(?<!\S)\\)(?P<list>[-*+])\s
+        |(?<=(?<!\S)\\)(?P<bq>>)\s
+        |(?P<hr>(?=-(?:[-*]|\\\*){2}))
+        |(?P<num>(?=\d+\.))
+        |(?P<trail>\s*$)
+        |(?=(?P<char>[#+_*`\[\]().]))
+    )
+""", re.MULTILINE | re.VERBOSE)
+
+# Name of the _PATTERNS entry that cleans each single-character escape, used
+# so changes_made counts pattern types exactly like the sequential passes
+_CHAR_KINDS = {
+    '#': 'hdr', '+': 'plus', '_': 'und', '*': 'emph', '`': 'code',
+    '[': 'brack', ']': 'brack', '(': 'paren', ')': 'paren', '.': 'period',
+}
+
+
+# Escapes that the patterns clean the same way wherever they appear and that no
+# other pattern looks at. _clean_fused drops them with str.replace, a C-level
+# scan, so the regex (and its Python callback) only sees the contextual ones.
+# '.' stays in the regex because numbered lists look for it after the digits
+# (dropping every \. up front would turn \1\. into a numbered list), and '*' and
+# '+' because list markers and horizontal rules depend on what surrounds them.
+# This loop already runs in native code, so a compiled byte kernel (Cython, or
+# Numba's JIT) would only add an encode/decode round trip, even for ASCII-only
+# text, plus a build step or heavy dependency for the CLI and the app bundle.
+_CONTEXT_FREE_ESCAPES = tuple(('\\' + char, char, _CHAR_KINDS[char]) for char in '#_`[]()')
+
+
+def _clean_fused(content):
+    """
+    Clean content with str.replace for the context-free escapes and a single
+    _FUSED_PATTERN scan for the rest.
+    
+    Returns the same (cleaned_content, changes_made, substitutions) as applying
+    _PATTERNS in order, provided the content contains no doubled backslashes.
+    """
+    kinds = set()
+    substitutions = 0
+    for escape, char, kind in _CONTEXT_FREE_ESCAPES:
+        count = content.count(escape)
+        if count:
+            content = content.replace(escape, char)
+            kinds.add(kind)
+            substitutions += count
+    
+    # Google Docs exports often escape nothing but these characters, in which
+    # case no backslash is left and the regex scan can be skipped entirely
+    if '\\' not in content:
+        return content, len(kinds), substitutions
+    
+    # End of the last list/blockquote match. Its trailing whitespace was consumed,
+    # so the sequential pass could not use it as the next marker's leading space.
+    last_end = {'list': -1, 'bq': -1}
+    
+    def dispatch(match):
+        nonlocal substitutions
+        substitutions += 1
+        kind = match.lastgroup
+        if kind == 'char':
+            kinds.add(_CHAR_KINDS[match.group('char')])
+            return ''
+        if kind == 'list' or kind == 'bq':
+            start = match.start()
+            if start == last_end[kind] and match.string[start - 1] != '\n':
+                # Left for the later emphasis/plus passes, or not cleaned at all
+                marker = match.group(kind)
+                if marker == '*' or marker == '+':
+                    kinds.add(_CHAR_KINDS[marker])
+                    return match.group(0)[1:]
+                substitutions -= 1
+                return match.group(0)
+            last_end[kind] = match.end()
+            kinds.add(kind)
+            return match.group(kind) + ' '
+        if kind == 'num':
+            # Numbered lists after whitespace and mid-text are separate passes
+            start = match.start()
+            if start and not match.string[start - 1].isspace():
+                kind = 'num_inline'
+        kinds.add(kind)
+        return ''
+    
+    cleaned_content = _FUSED_PATTERN.sub(dispatch, content)
+    return cleaned_content, len(kinds), substitutions
+
+
+# clean_directory keeps up to _READ_AHEAD files loaded ahead of the one being
+# cleaned, spread across _READER_THREADS reader threads
+_READ_AHEAD = 8
+_READER_THREADS = 4
+
+
+def _read_text(file_path):
+    """Read a UTF-8 file, returning (content, error_message)"""
+    try:
+        content = _read_mapped(file_path)
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+        return content, None
+    except FileNotFoundError:
+        return None, f"❌ File not found: {file_path}"
+    except Exception as e:
+        return None, f"❌ Error reading file {file_path}: {e}"
+
+
+def _read_mapped(file_path):
+    """
+    Decode a UTF-8 file straight from a memory map of it.
+    
+    This skips the intermediate bytes buffer a regular read() fills before
+    decoding. Returns None when the file should be read in text mode instead:
+    it contains carriage returns (which need universal newline translation),
+    is empty, or cannot be mapped.
+    """
+    with open(file_path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return None
+        with mapped:
+            if mapped.find(b'\r') != -1:
+                return None
+            return str(mapped, 'utf-8')
+
+
+def _write_text(file_path, content):
+    """
+    Write a UTF-8 file atomically where possible, returning an error message or None on success
+    
+    An existing file is replaced by writing a temporary file in the same
+    directory, flushing it to disk and renaming it over the original, so a
+    crash mid-write never leaves a truncated file behind. Symlinks are resolved
+    first so the file they point to is replaced, and its permissions are kept,
+    as are its owner and group where this process is allowed to set them (only
+    root can give a file to another user, so otherwise the file becomes ours).
+    
+    Files with other hard links are rewritten in place so the links keep
+    sharing the new content, and so are files in directories we cannot create
+    the temporary file in (a writable file in a read-only directory).
+    """
+    temp_path = None
+    try:
+        target = os.path.realpath(file_path)
+        if not os.path.exists(target):
+            # Nothing to protect yet, and open() applies the usual umask
+            _write_in_place(target, content)
+            return None
+        
+        info = os.stat(target)
+        if info.st_nlink > 1:
+            _write_in_place(target, content)
+            return None
+        
+        directory, name = os.path.split(target)
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        except OSError:
+            _write_in_place(target, content)
+            return None
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, stat.S_IMODE(info.st_mode))
+        if hasattr(os, 'chown'):
+            try:
+                os.chown(temp_path, info.st_uid, info.st_gid)
+            except OSError:
+                pass
+        os.replace(temp_path, target)
+        return None
+    except Exception as e:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
+        return f"❌ Error writing file {file_path}: {e}"
+
+
+def _write_in_place(path, content):
+    """Overwrite a file's content directly, keeping its inode, links and ownership"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
 
 
 class MarkdownCleaner:
     """Cleans escaped markdown characters from markdown files"""
     
-    def __init__(self, dry_run=False, verbose=False):
+    def __init__(self, dry_run=False, verbose=False, jobs=1):
         self.dry_run = dry_run
         self.verbose = verbose
+        # Worker processes used by clean_directory (None means one per CPU)
+        self.jobs = jobs
         self.files_processed = 0
         self.files_cleaned = 0
         self.total_changes = 0
+        self.total_substitutions = 0
     
     def clean_escaped_markdown(self, content):
         """
@@ -45,90 +325,60 @@ class MarkdownCleaner:
             tuple: (cleaned_content, changes_made) where changes_made is the
                    number of different pattern types that were cleaned
         """
+        cleaned_content, changes_made, _ = self._clean_escaped(content)
+        return cleaned_content, changes_made
+    
+    def _clean_escaped(self, content):
+        """
+        Clean escaped markdown, also counting individual substitutions
+        
+        Returns:
+            tuple: (cleaned_content, changes_made, substitutions) where
+                   substitutions is the total number of escapes cleaned
+        """
         if not content:
-            return content, 0
+            return content, 0, 0
             
         # First, check if content appears to be escaped (heuristic)
-        escaped_indicators = [
-            r'\\#',          # Escaped headers
-            r'\\-\s',        # Escaped lists  
-            r'\\\*.*\\\*',   # Escaped emphasis
-            r'\\\d+\.',      # Escaped numbered lists
-            r'\\>',          # Escaped blockquotes
-            r'\\\[.*\\\]',   # Escaped links
-            r'\\\+',         # Escaped plus signs
-            r'\\\_',         # Escaped underscores in text
-            r'\\\s*$',       # Trailing standalone backslashes
-        ]
-        
         # Count potential escaped markdown patterns
         escape_count = 0
-        for indicator in escaped_indicators:
-            if re.search(indicator, content):
-                escape_count += 1
+        # Content without a single backslash cannot contain escapes, and a
+        # substring check is far cheaper than running every indicator regex
+        if '\\' in content:
+            escape_count = sum(1 for indicator in _LITERAL_INDICATORS if indicator in content)
+            if self.verbose:
+                escape_count += sum(1 for indicator in _INDICATORS if indicator.search(content))
+            elif escape_count == 0 and any(indicator.search(content) for indicator in _INDICATORS):
+                # The exact count is only reported in verbose mode
+                escape_count = 1
         
         # If no escaped patterns detected, return original content
         if escape_count == 0:
             if self.verbose:
                 print(f"   ℹ️  No escaped markdown patterns detected")
-            return content, 0
+            return content, 0, 0
             
         if self.verbose:
             print(f"   🔍 Detected {escape_count} types of escaped markdown patterns")
         
-        # Pattern to match escaped markdown characters
-        # Matches: \# \* \- \+ \. \1 \2 etc.
-        # Ordered by specificity to avoid conflicts
-        patterns = [
-            # Headers: \# \## \### etc. (handle escaped consecutive hashes)
-            (r'\\(#{1,6})', r'\1'),
-            
-            # Lists: \- \* \+ at start of line or after whitespace
-            (r'(^|\s)\\([-*+])\s', r'\1\2 '),
-            
-            # Numbered lists: \1. \2. etc. (both at start of line and mid-text)
-            (r'(^|\s)\\(\d+)\.', r'\1\2.'),
-            (r'\\(\d+)\.', r'\1.'),  # Catch remaining escaped numbers with dots
-            
-            # Escaped plus signs: \+1-2 → +1-2
-            (r'\\(\+)', r'\1'),
-            
-            # Escaped underscores in text: project\_system\_instructions → project_system_instructions
-            (r'\\(_)', r'\1'),
-            
-            # Emphasis: \*text\* \_text\_ (but not legitimate double backslashes)
-            (r'(?<!\\)\\([*_])', r'\1'),
-            
-            # Inline code: \`code\`
-            (r'(?<!\\)\\(`)', r'\1'),
-            
-            # Links: \[text\]\(url\) (but preserve legitimate escapes)
-            (r'(?<!\\)\\([\[\]])', r'\1'),
-            (r'(?<!\\)\\([()])', r'\1'),
-            
-            # Horizontal rules: \--- \***
-            (r'(?<!\\)\\([-*]{3,})', r'\1'),
-            
-            # Blockquotes: \> 
-            (r'(^|\s)\\(>)\s', r'\1\2 '),
-            
-            # Trailing standalone backslashes (common in Google Docs exports)
-            (r'\\\s*$', r''),
-            
-            # Escaped periods in general text (not just numbered lists)
-            (r'(?<!\\)\\(\.)', r'\1'),
-        ]
-        
-        cleaned_content = content
-        changes_made = 0
-        
-        for pattern, replacement in patterns:
-            before_length = len(cleaned_content)
-            cleaned_content = re.sub(pattern, replacement, cleaned_content, flags=re.MULTILINE)
-            after_length = len(cleaned_content)
+        if '\\\\' not in content:
+            # Fast path: clean every pattern type in a single scan
+            cleaned_content, changes_made, substitutions = _clean_fused(content)
+        else:
+            # Doubled backslashes let earlier passes expose new escapes to later
+            # ones, so apply each pattern in order. A pass without matches hands
+            # back the same string object, so only passes that clean something
+            # allocate a new copy. Lists and trailing backslashes can consume
+            # the newline after them, so the passes cannot run line by line.
+            cleaned_content = content
+            changes_made = 0
+            substitutions = 0
             
-            if before_length != after_length:
-                changes_made += 1
+            for pattern, replacement in _PATTERNS:
+                cleaned_content, count = pattern.subn(replacement, cleaned_content)
+                if count:
+                    changes_made += 1
+                    substitutions += count
         
         # Report cleanup results
         if self.verbose:
@@ -137,30 +387,22 @@ class MarkdownCleaner:
             else:
                 print(f"   ℹ️  No escaped markdown characters found to clean")
         
-        return cleaned_content, changes_made
+        return cleaned_content, changes_made, substitutions
     
     def read_file(self, file_path):
         """Read markdown file content"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            return content
-        except FileNotFoundError:
-            print(f"❌ File not found: {file_path}")
-            return None
-        except Exception as e:
-            print(f"❌ Error reading file {file_path}: {e}")
-            return None
+        content, error = _read_text(file_path)
+        if error:
+            print(error)
+        return content
     
     def write_file(self, file_path, content):
         """Write content to markdown file"""
-        try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(content)
-            return True
-        except Exception as e:
-            print(f"❌ Error writing file {file_path}: {e}")
+        error = _write_text(file_path, content)
+        if error:
+            print(error)
             return False
+        return True
     
     def clean_file(self, file_path):
         """Clean a single markdown file"""
@@ -171,30 +413,57 @@ class MarkdownCleaner:
         if content is None:
             return False
         
-        # Clean escaped markdown
-        cleaned_content, changes_made = self.clean_escaped_markdown(content)
+        cleaned_content, changes_made, substitutions = self._clean_content(content)
         
         # Track statistics
-        self.files_processed += 1
-        if changes_made > 0:
-            self.files_cleaned += 1
-            self.total_changes += changes_made
+        self._add_statistics(1, 1 if changes_made > 0 else 0, changes_made, substitutions)
         
         # Write cleaned content (unless dry run)
-        if changes_made > 0:
-            if self.dry_run:
-                print(f"   🔍 [DRY RUN] Would clean {changes_made} pattern types")
-            else:
-                if self.write_file(file_path, cleaned_content):
-                    print(f"   ✅ Cleaned {changes_made} pattern types")
-                else:
-                    print(f"   ❌ Failed to write cleaned content")
-                    return False
-        else:
-            print(f"   ✨ File already clean")
+        if changes_made > 0 and not self.dry_run:
+            written = self.write_file(file_path, cleaned_content)
+            return self._report_write(changes_made, written)
         
         return True
     
+    def _clean_content(self, content):
+        """
+        Clean one file's content, reporting files that need no write
+        
+        Statistics are left to the caller, so clean_directory can total them
+        in local variables instead of updating attributes for every file.
+        
+        Returns:
+            tuple: (cleaned_content, changes_made, substitutions) where both
+                   counts are 0 when no character actually changed
+        """
+        # Clean escaped markdown
+        cleaned_content, changes_made, substitutions = self._clean_escaped(content)
+        if cleaned_content == content:
+            # Nothing to write back (or count) when no character actually changed
+            changes_made = substitutions = 0
+        
+        if changes_made == 0:
+            print(f"   ✨ File already clean")
+        elif self.dry_run:
+            print(f"   🔍 [DRY RUN] Would clean {changes_made} pattern types")
+        
+        return cleaned_content, changes_made, substitutions
+    
+    def _add_statistics(self, processed, cleaned, changes, substitutions):
+        """Add a batch of files' counts to the running statistics"""
+        self.files_processed += processed
+        self.files_cleaned += cleaned
+        self.total_changes += changes
+        self.total_substitutions += substitutions
+    
+    def _report_write(self, changes_made, written):
+        """Report whether a cleaned file was written"""
+        if written:
+            print(f"   ✅ Cleaned {changes_made} pattern types")
+        else:
+            print(f"   ❌ Failed to write cleaned content")
+        return written
+    
     def find_markdown_files(self, path):
         """Find all .md files in a directory (recursive)"""
         if os.path.isfile(path):
@@ -209,13 +478,31 @@ class MarkdownCleaner:
             return []
         
         # Find all .md files recursively
-        md_files = []
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.endswith('.md'):
-                    md_files.append(os.path.join(root, file))
+        return list(self.iter_markdown_files(path))
+    
+    def iter_markdown_files(self, path):
+        """
+        Yield the .md files under a directory (recursive), skipping hidden directories
         
-        return sorted(md_files)
+        Files are yielded lazily in sorted path order. Each directory's entries
+        are sorted as they are scanned, with a trailing separator on
+        subdirectory names so their contents land exactly where a sort of the
+        full paths would put them. Like os.walk, symlinked directories are not
+        followed and unreadable directories are skipped.
+        """
+        try:
+            with os.scandir(path) as scan:
+                entries = [(entry.name + '/' if entry.is_dir() else entry.name, entry)
+                           for entry in scan]
+        except OSError:
+            return
+        
+        for _, entry in sorted(entries, key=lambda item: item[0]):
+            if entry.is_dir():
+                if not entry.name.startswith('.') and not entry.is_symlink():
+                    yield from self.iter_markdown_files(entry.path)
+            elif entry.name.endswith('.md'):
+                yield entry.path
     
     def clean_directory(self, path):
         """Clean all markdown files in a directory"""
@@ -229,11 +516,10 @@ class MarkdownCleaner:
         print("")
         
         # Process each file
-        success_count = 0
-        for file_path in md_files:
-            if self.clean_file(file_path):
-                success_count += 1
-            print("")  # Blank line between files
+        if self.jobs != 1 and len(md_files) > 1:
+            success_count = self._clean_files_parallel(md_files)
+        else:
+            success_count = self._clean_files_pipelined(md_files)
         
         # Print summary
         print("📊 SUMMARY")
@@ -241,6 +527,7 @@ class MarkdownCleaner:
         print(f"Files processed: {self.files_processed}")
         print(f"Files cleaned: {self.files_cleaned}")
         print(f"Total pattern types cleaned: {self.total_changes}")
+        print(f"Total escapes cleaned: {self.total_substitutions}")
         print(f"Success rate: {success_count}/{len(md_files)} files")
         
         if self.dry_run:
@@ -249,12 +536,136 @@ class MarkdownCleaner:
             print("Run without --dry-run to apply changes")
         
         return success_count == len(md_files)
+    
+    def _clean_files_pipelined(self, md_files):
+        """
+        Clean files in this process, overlapping disk I/O with cleaning.
+        
+        Reader threads prefetch the next few files while the current one is
+        cleaned, and a writer thread saves cleaned files in the background.
+        Each file's messages are buffered and printed in order once its write
+        has finished, so the output matches cleaning files one at a time.
+        """
+        # Totalled locally and added to the statistics once at the end
+        success_count = processed = cleaned = changes = substitutions = 0
+        files = iter(md_files)
+        reads = deque()
+        # (file_path, output, success, changes_made, write) awaiting their write
+        pending = deque()
+        
+        def finish(file_path, output, success, changes_made, write):
+            if write is not None:
+                report = io.StringIO()
+                with contextlib.redirect_stdout(report):
+                    error = write.result()
+                    if error:
+                        print(error)
+                    success = self._report_write(changes_made, error is None)
+                output += report.getvalue()
+            # One write per file, ending in the blank line between files, so a
+            # line-buffered terminal is flushed once per file rather than per line
+            print(output)
+            return success
+        
+        with ThreadPoolExecutor(max_workers=_READER_THREADS) as readers, \
+                ThreadPoolExecutor(max_workers=1) as writer:
+            def prefetch():
+                file_path = next(files, None)
+                if file_path is not None:
+                    reads.append((file_path, readers.submit(_read_text, file_path)))
+            
+            for _ in range(_READ_AHEAD):
+                prefetch()
+            
+            while reads:
+                file_path, read = reads.popleft()
+                prefetch()
+                content, error = read.result()
+                
+                # Only this thread prints, so its output can be captured safely
+                output = io.StringIO()
+                success, changes_made, write = False, 0, None
+                with contextlib.redirect_stdout(output):
+                    print(f"📄 Processing: {file_path}")
+                    if error:
+                        print(error)
+                    else:
+                        success = True
+                        cleaned_content, changes_made, count = self._clean_content(content)
+                        processed += 1
+                        if changes_made > 0:
+                            cleaned += 1
+                            changes += changes_made
+                            substitutions += count
+                        if changes_made > 0 and not self.dry_run:
+                            write = writer.submit(_write_text, file_path, cleaned_content)
+                pending.append((file_path, output.getvalue(), success, changes_made, write))
+                
+                # Print every file at the front of the queue that is finished
+                while pending and (pending[0][4] is None or pending[0][4].done()):
+                    if finish(*pending.popleft()):
+                        success_count += 1
+            
+            while pending:
+                if finish(*pending.popleft()):
+                    success_count += 1
+        
+        self._add_statistics(processed, cleaned, changes, substitutions)
+        return success_count
+    
+    def _clean_files_parallel(self, md_files):
+        """Clean files across worker processes, printing their output in order"""
+        workers = min(self.jobs or os.cpu_count() or 1, len(md_files))
+        # Hand out files in batches so small files don't pay one round trip each
+        chunksize = max(1, len(md_files) // (workers * 4))
+        
+        # Totalled locally and added to the statistics once at the end
+        success_count = processed = cleaned = changes = substitutions = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_clean_file_worker, md_files,
+                                   repeat(self.dry_run), repeat(self.verbose),
+                                   chunksize=chunksize)
+            for success, file_processed, file_cleaned, file_changes, file_substitutions, output in results:
+                print(output)  # Includes the blank line between files
+                processed += file_processed
+                cleaned += file_cleaned
+                changes += file_changes
+                substitutions += file_substitutions
+                if success:
+                    success_count += 1
+        
+        self._add_statistics(processed, cleaned, changes, substitutions)
+        return success_count
+
+
+def _clean_file_worker(file_path, dry_run, verbose):
+    """
+    Clean a single file in a worker process for clean_directory.
+    
+    Output is captured instead of printed so the parent process can print each
+    file's messages in order without interleaving.
+    
+    Returns:
+        tuple: (success, files_processed, files_cleaned, total_changes,
+                total_substitutions, output)
+    """
+    cleaner = MarkdownCleaner(dry_run=dry_run, verbose=verbose)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success = cleaner.clean_file(file_path)
+    return (success, cleaner.files_processed, cleaner.files_cleaned,
+            cleaner.total_changes, cleaner.total_substitutions, output.getvalue())
+
+
+# Shared by the convenience function. Cleaning content only reads the cleaner's
+# verbose flag, so one quiet instance can serve every call.
+_SHARED_CLEANER = MarkdownCleaner()
 
 
 # Convenience function for backward compatibility
 def clean_escaped_markdown(content):
     """
-    Convenience function that creates a MarkdownCleaner instance and cleans content.
+    Convenience function that cleans content with a shared MarkdownCleaner instance.
     
     This function is provided for backward compatibility with code that expects
     a simple function interface.
@@ -265,6 +676,5 @@ def clean_escaped_markdown(content):
     Returns:
         str: Cleaned markdown content
     """
-    cleaner = MarkdownCleaner()
-    cleaned_content, _ = cleaner.clean_escaped_markdown(content)
+    cleaned_content, _ = _SHARED_CLEANER.clean_escaped_markdown(content)
     return cleaned_content
\ No newline at end of file
@@ -6,12 +6,202 @@
 # - ttk is the themed widget set for tkinter, which gives a more modern look.
 # - re is for regular expression operations, used for the cleaning logic.
 # - os is for interacting with the operating system, used here to get file basenames.
+# - threading runs the cleaning and file reading in the background so the window stays responsive.
+# - queue passes the chunks read in the background to the main thread, a few at a time.
+# - mmap maps opened files into memory so they can be decoded without reading them into one copy first.
+# - codecs provides the incremental UTF-8 decoder used to decode them a chunk at a time.
+# - difflib finds the lines that changed, so the output area is only updated where needed.
+# - font measures the line height used by the output viewer.
+# - heapq picks the longest lines of a large result, which are measured to size the viewer.
+# - hashlib and OrderedDict keep a small cache of recent cleaning results.
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import ttk
+from tkinter import font as tkfont
 import os
+import mmap
+import codecs
+import threading
+import queue
+import difflib
+import heapq
+import hashlib
+from collections import OrderedDict
 from markdown_cleaner import MarkdownCleaner
 
+# Large files are read, inserted and saved in chunks of this many characters
+# (256 KiB for plain text), so the window keeps redrawing while a multi-MB file loads.
+CHUNK_SIZE = 1 << 18
+
+# When more than this fraction of the output's lines changed, the output area is
+# refilled from scratch instead of being patched line by line.
+MAX_PATCHED_FRACTION = 0.3
+
+# Number of recent cleaning results kept, so re-opening a file isn't cleaned again.
+CLEAN_CACHE_SIZE = 8
+
+# While a file loads, the window inserts up to this many chunks it has read every
+# LOAD_POLL_MS milliseconds, redrawing in between.
+LOAD_CHUNKS_PER_POLL = 4
+LOAD_POLL_MS = 10
+
+# Cleaned results longer than this many characters (about 1 MB of plain text) are
+# shown in a VirtualTextView; shorter ones in a regular, wrapped and selectable text area.
+LARGE_OUTPUT_CHARS = 1 << 20
+
+# The ttk theme picked for this platform, looked up once per process.
+_CHOSEN_THEME = None
+
+
+def iter_utf8_chunks(data, chunk_size=CHUNK_SIZE):
+    """
+    Decodes UTF-8 data (e.g. a mapped file) one chunk at a time.
+    The incremental decoder holds back a multi-byte character split between two
+    chunks until the rest of it arrives, so at most one chunk is decoded at once.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for start in range(0, len(data), chunk_size):
+        # Slicing a mapped file copies the chunk into bytes. A memoryview slice would
+        # stay referenced from a decode error's traceback and keep the map from closing.
+        text = decoder.decode(data[start:start + chunk_size])
+        if text:
+            yield text
+    # Raises an error if the data ends part way through a character.
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def read_file_chunks(file_path):
+    """Reads a UTF-8 file as a series of text chunks instead of as one string."""
+    with open(file_path, 'rb') as file:
+        try:
+            # Decoding straight from a memory map skips reading the whole file into a bytes copy.
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None # Empty files (and some special files) cannot be mapped.
+        if mapped is not None and mapped.find(b'\r') == -1:
+            with mapped:
+                yield from iter_utf8_chunks(mapped)
+            return
+        if mapped is not None:
+            mapped.close()
+
+    # Text mode turns Windows line endings into plain newlines, as the mapped path can't.
+    # A read buffer as large as the chunks means one system call per chunk.
+    with open(file_path, 'r', encoding='utf-8', buffering=CHUNK_SIZE) as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+def split_lines(text):
+    """
+    Splits text into lines the way a Tk text widget counts them: on newlines
+    only, each line keeping its newline.
+    """
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+# --- Output Viewer ---
+class VirtualTextView(ttk.Frame):
+    """
+    A read-only, scrollable text viewer that only draws the lines currently in view.
+    Unlike a Text widget, showing a new document doesn't lay out every one of its
+    lines, so even multi-MB results appear instantly. Lines are not wrapped, so
+    long lines are read by scrolling sideways.
+    """
+    def __init__(self, master, font=("Helvetica", 12), **kwargs):
+        super().__init__(master, **kwargs)
+        self._font = tkfont.Font(self, font=font)
+        self._line_height = self._font.metrics("linespace")
+        self._char_width = self._font.measure("0") # One horizontal scroll unit.
+        self._lines = [] # The document, one string per line.
+        self._first = 0 # Index of the line shown at the top.
+        self._x = 0 # How far the view is scrolled to the right, in pixels.
+        self._width = 0 # Width of the widest line, in pixels.
+
+        self.xscrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.xview)
+        self.xscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=1, highlightbackground="black")
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Redraw when resized, and scroll with the mouse wheel (X11 sends buttons 4 and 5 instead).
+        # Holding Shift scrolls sideways.
+        self.canvas.bind("<Configure>", lambda event: self._redraw())
+        self.canvas.bind("<MouseWheel>", lambda event: self._on_mousewheel(event, self.yview))
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self._on_mousewheel(event, self.xview))
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.canvas.bind("<Shift-Button-4>", lambda event: self.xview("scroll", -1, "units"))
+        self.canvas.bind("<Shift-Button-5>", lambda event: self.xview("scroll", 1, "units"))
+
+    def set_lines(self, lines):
+        """Shows a new document, given as a list of lines, from its top left corner."""
+        self._lines = lines
+        self._first = 0
+        self._x = 0
+        # Measuring every line would take seconds, so only the lines with the most characters
+        # are. The font is proportional, so a slightly shorter line of wide characters can
+        # still be wider than all of them; the margin of a few characters covers that.
+        longest = heapq.nlargest(16, lines, key=len)
+        self._width = max(map(self._font.measure, longest)) + 8 + 4 * self._char_width if lines else 0
+        self._redraw()
+
+    def _visible_rows(self):
+        """Returns how many lines fit in the viewer."""
+        return max(1, self.canvas.winfo_height() // self._line_height)
+
+    def yview(self, *args):
+        """Scrolls the viewer up or down. Takes the same arguments a scrollbar passes to its command."""
+        rows = self._visible_rows()
+        if args[0] == "moveto":
+            first = int(float(args[1]) * len(self._lines))
+        else: # ("scroll", amount, "units" or "pages")
+            amount = int(args[1])
+            first = self._first + (amount * rows if args[2] == "pages" else amount)
+        self._first = max(0, min(first, len(self._lines) - rows))
+        self._redraw()
+
+    def xview(self, *args):
+        """Scrolls the viewer sideways. Takes the same arguments a scrollbar passes to its command."""
+        visible_width = self.canvas.winfo_width()
+        if args[0] == "moveto":
+            x = int(float(args[1]) * self._width)
+        else: # ("scroll", amount, "units" or "pages")
+            amount = int(args[1])
+            x = self._x + amount * (visible_width if args[2] == "pages" else self._char_width)
+        self._x = max(0, min(x, self._width - visible_width))
+        self._redraw()
+
+    def _on_mousewheel(self, event, view):
+        """Scrolls by the wheel movement. Windows reports it in steps of 120, macOS per unit."""
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        view("scroll", -delta, "units")
+
+    def _redraw(self):
+        """Draws only the lines in view, and updates the scrollbars to match."""
+        self.canvas.delete("all")
+        rows = self._visible_rows()
+        visible = self._lines[self._first:self._first + rows + 1] # One more for a partly shown line.
+        for row, line in enumerate(visible):
+            self.canvas.create_text(4 - self._x, 2 + row * self._line_height, text=line, anchor="nw", font=self._font)
+        if self._lines:
+            self.scrollbar.set(self._first / len(self._lines), min(1.0, (self._first + rows) / len(self._lines)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        if self._width:
+            visible_width = self.canvas.winfo_width()
+            self.xscrollbar.set(self._x / self._width, min(1.0, (self._x + visible_width) / self._width))
+        else:
+            self.xscrollbar.set(0.0, 1.0)
+
+
 # --- GUI Application Class ---
 class MarkdownCleanerApp(tk.Tk):
     """
@@ -27,16 +217,36 @@ class MarkdownCleanerApp(tk.Tk):
         self.geometry("1000x700")  # Set the initial size of the window.
 
         # Configure the visual style of the application's widgets.
+        global _CHOSEN_THEME
         self.style = ttk.Style(self)
-        try:
-            # 'aqua' provides the native macOS look and feel.
-            self.style.theme_use("aqua") 
-        except tk.TclError:
-            # If 'aqua' is not available (e.g., on Windows or Linux), use the default theme.
-            self.style.theme_use("default")
+        if _CHOSEN_THEME is None:
+            # 'aqua' provides the native macOS look and feel. If it is not available
+            # (e.g., on Windows or Linux), use the default theme.
+            _CHOSEN_THEME = "aqua" if "aqua" in self.style.theme_names() else "default"
+        self.style.theme_use(_CHOSEN_THEME)
 
         # Create an instance of the MarkdownCleaner to handle the cleaning logic.
+        # Its patterns were compiled once when markdown_cleaner was imported, and
+        # compiled patterns can be shared safely with the cleaning thread.
         self.cleaner = MarkdownCleaner()
+        # Hash and result of the last input cleaned, so cleaning unchanged text again is skipped.
+        self._last_input_hash = None
+        self._last_output = None
+        # Lines currently in the output text area, to work out which ones a new result changes.
+        self._last_output_lines = []
+        # Recent cleaning results keyed by a digest of their input, least recently used first.
+        # Digests keep the cache small, as large inputs themselves would not be stored.
+        self._clean_cache = OrderedDict()
+        # True while a background thread is cleaning, so runs never overlap.
+        self._cleaning = False
+        # Pending scheduled cleaning run, so bursts of triggers collapse into one run.
+        self._clean_after_id = None
+        # True while a file is being read into the input area, during which it isn't cleaned.
+        self._loading = False
+        # Latest status bar message and its scheduled redraw, so quick successive
+        # messages only repaint the status bar once.
+        self._pending_status = None
+        self._status_after = None
         # Call the method to create all the widgets (buttons, text areas, etc.).
         self.create_widgets()
 
@@ -49,7 +259,8 @@ class MarkdownCleanerApp(tk.Tk):
         main_frame.pack(fill=tk.BOTH, expand=True) # Make the frame fill the entire window.
 
         # A PanedWindow is a container that allows the user to resize its child widgets.
-        paned_window = ttk.PanedWindow(main_frame, orient=tk.HORIZONTAL, sashwidth=8)
+        # Kept as an attribute so it can be held busy while a file loads.
+        self.paned_window = paned_window = ttk.PanedWindow(main_frame, orient=tk.HORIZONTAL, sashwidth=8)
         paned_window.pack(fill=tk.BOTH, expand=True)
 
         # --- Input Pane (Left Side) ---
@@ -57,14 +268,20 @@ class MarkdownCleanerApp(tk.Tk):
         ttk.Label(input_frame, text="Original Markdown", font=("Helvetica", 14, "bold")).pack(pady=(0, 5), anchor="w")
         self.input_text = scrolledtext.ScrolledText(input_frame, wrap=tk.WORD, height=10, width=50, font=("Helvetica", 12), relief="solid", bd=1)
         self.input_text.pack(fill=tk.BOTH, expand=True)
-        paned_window.add(input_frame) # Add the input frame to the PanedWindow.
+        # Clean again automatically shortly after the user stops typing or pasting.
+        self.input_text.bind("<<Modified>>", self._on_input_modified)
+        # Add the input frame to the PanedWindow. Equal weights share the window's
+        # spare width between both panes, so the (initially empty) output pane still grows.
+        paned_window.add(input_frame, weight=1)
         
         # --- Output Pane (Right Side) ---
-        output_frame = ttk.Frame(paned_window, padding="5")
-        ttk.Label(output_frame, text="Cleaned Markdown", font=("Helvetica", 14, "bold")).pack(pady=(0, 5), anchor="w")
-        self.output_text = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD, height=10, width=50, font=("Helvetica", 12), state="disabled", relief="solid", bd=1)
-        self.output_text.pack(fill=tk.BOTH, expand=True)
-        paned_window.add(output_frame) # Add the output frame to the PanedWindow.
+        self._output_frame = ttk.Frame(paned_window, padding="5")
+        ttk.Label(self._output_frame, text="Cleaned Markdown", font=("Helvetica", 14, "bold")).pack(pady=(0, 5), anchor="w")
+        # The output widgets are only created once there is something to show, keeping startup quick.
+        # output_text shows ordinary results, output_view very large ones (see LARGE_OUTPUT_CHARS).
+        self.output_text = None
+        self.output_view = None
+        paned_window.add(self._output_frame, weight=1) # Add the output frame to the PanedWindow.
 
         # --- Bottom Control Area ---
         bottom_frame = ttk.Frame(main_frame)
@@ -75,8 +292,12 @@ class MarkdownCleanerApp(tk.Tk):
         button_container.pack(side=tk.LEFT, expand=True, fill=tk.X)
 
         # Create and place the buttons, linking them to their respective methods.
-        ttk.Button(button_container, text="Open File...", command=self.open_file).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_container, text="Clean Text", command=self.clean_text).pack(side=tk.LEFT, padx=5)
+        # Kept as an attribute so it can be disabled while a file loads.
+        self.open_button = ttk.Button(button_container, text="Open File...", command=self.open_file)
+        self.open_button.pack(side=tk.LEFT, padx=5)
+        # Kept as an attribute so it can be disabled while cleaning runs in the background.
+        self.clean_button = ttk.Button(button_container, text="Clean Text", command=self.clean_text)
+        self.clean_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_container, text="Copy to Clipboard", command=self.copy_to_clipboard).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_container, text="Save As...", command=self.save_file).pack(side=tk.RIGHT, padx=5)
 
@@ -84,8 +305,24 @@ class MarkdownCleanerApp(tk.Tk):
         self.status_label = ttk.Label(main_frame, text="Ready", anchor="w", padding=(5,2))
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
+    def set_status(self, text):
+        """Shows a message in the status bar once the window is next idle."""
+        self._pending_status = text
+        if self._status_after is None:
+            self._status_after = self.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Shows the latest status message. Earlier ones since the last redraw are never painted."""
+        self._status_after = None
+        self.status_label.config(text=self._pending_status)
+
     def open_file(self):
         """Handles the 'Open File...' button click. Opens a file dialog and loads content."""
+        if self._loading:
+            # Only one file loads at a time, so don't offer a choice that would be ignored.
+            self.set_status("Still loading the previous file. Please wait.")
+            return
+
         file_path = filedialog.askopenfilename(
             title="Open Markdown File",
             filetypes=(("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*"))
@@ -94,54 +331,263 @@ class MarkdownCleanerApp(tk.Tk):
         if not file_path:
             return
 
+        # Read the file in a background thread, inserting its chunks as they arrive.
+        previous_text = self.input_text.get("1.0", "end-1c") # Put back if the file can't be read.
+        self.input_text.delete('1.0', tk.END) # Clear existing text.
+        self._set_loading(True)
+        self.set_status(f"Loading: {os.path.basename(file_path)}")
+        # The queue holds two polls' worth of chunks, so the reader waits for the window to
+        # insert them instead of decoding the whole file into memory ahead of it.
+        chunks = queue.Queue(maxsize=LOAD_CHUNKS_PER_POLL * 2)
+        threading.Thread(target=self._reader_thread, args=(file_path, chunks), daemon=True).start()
+        self.after(LOAD_POLL_MS, self._drain_queue, file_path, chunks, previous_text)
+
+    def _schedule_clean(self, delay_ms=150):
+        """Cleans the text after a delay, replacing any run that is already scheduled."""
+        if self._clean_after_id:
+            self.after_cancel(self._clean_after_id)
+        self._clean_after_id = self.after(delay_ms, self.clean_text)
+
+    def _on_input_modified(self, event):
+        """Handles edits to the input area by scheduling a cleaning run."""
+        # Tk sends <<Modified>> only when the modified flag changes, so reset it to
+        # hear about the next edit. Resetting it sends the event again, which is ignored.
+        if not self.input_text.edit_modified():
+            return
+        self.input_text.edit_modified(False)
+        if not self._loading: # A loaded file is cleaned once it has been read completely.
+            self._schedule_clean(300)
+
+    def _reader_thread(self, file_path, chunks):
+        """Runs in the background thread. Reads the file and queues its chunks for the main thread."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                self.input_text.delete('1.0', tk.END) # Clear existing text.
-                self.input_text.insert('1.0', content) # Insert new content.
-                self.status_label.config(text=f"Loaded: {os.path.basename(file_path)}")
-                self.clean_text() # Automatically clean the text after loading a file.
+            for chunk in read_file_chunks(file_path):
+                chunks.put(chunk) # Waits while the queue is full.
+            chunks.put(None) # Tells the main thread the whole file was read.
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to read file: {e}")
-            self.status_label.config(text="Error opening file")
+            chunks.put(e)
+
+    def _set_loading(self, loading):
+        """Marks a file load as started or finished, holding the panes busy in between."""
+        self._loading = loading
+        # Only one file loads at a time.
+        self.open_button.config(state="disabled" if loading else "normal")
+        # While busy, Tk sends the panes no mouse events (and shows a busy cursor), so
+        # clicks don't reach the half-loaded text. Keyboard focus isn't affected by
+        # that, so the input area is also made read-only, which ignores keystrokes;
+        # _drain_queue makes it editable only while inserting each chunk.
+        # Inserting text never changes the panes' requested sizes, so the
+        # PanedWindow does no layout work during the load and can stay visible.
+        self.input_text.config(state="disabled" if loading else "normal")
+        try:
+            self.tk.call('tk', 'busy', 'hold' if loading else 'forget', str(self.paned_window))
+        except tk.TclError:
+            pass # Tk before 8.6 has no busy command.
+
+    def _drain_queue(self, file_path, chunks, previous_text):
+        """Inserts the chunks read so far into the input area, then checks again shortly."""
+        for _ in range(LOAD_CHUNKS_PER_POLL):
+            try:
+                chunk = chunks.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                self._set_loading(False)
+                self.set_status(f"Loaded: {os.path.basename(file_path)}")
+                # Clean the text automatically once the loading has finished.
+                self._schedule_clean(0)
+                return
+            if isinstance(chunk, Exception):
+                # Replace the part read before the error with the text that was there before.
+                self.input_text.config(state="normal")
+                self.input_text.delete('1.0', tk.END)
+                self.input_text.insert('1.0', previous_text)
+                # Nothing changed in the end, so drop the <<Modified>> this sends (the dialog
+                # below runs the event loop) and any cleaning run scheduled before the load.
+                self.input_text.edit_modified(False)
+                if self._clean_after_id:
+                    self.after_cancel(self._clean_after_id)
+                    self._clean_after_id = None
+                self._set_loading(False)
+                messagebox.showerror("Error", f"Failed to read file: {chunk}")
+                self.set_status("Error opening file")
+                return
+            self.input_text.config(state="normal")
+            self.input_text.insert(tk.END, chunk)
+            self.input_text.config(state="disabled") # Keystrokes are ignored until the load ends.
+        # Returning to the event loop in between keeps the window redrawing while the file loads.
+        self.after(LOAD_POLL_MS, self._drain_queue, file_path, chunks, previous_text)
 
     def clean_text(self):
         """Handles the 'Clean Text' button click. Cleans the text from the input area."""
+        if self._loading:
+            return # The file is cleaned once it has been read completely.
+        if self._cleaning:
+            # A cleaning run is already in progress, so try again once it is likely done.
+            self._schedule_clean()
+            return
+
         original_content = self.input_text.get("1.0", tk.END)
         if not original_content.strip():
-            self.status_label.config(text="Input is empty. Nothing to clean.")
+            self.set_status("Input is empty. Nothing to clean.")
+            return
+
+        input_hash = hash(original_content)
+        if input_hash == self._last_input_hash:
+            # The output area already shows this input's cleaned text, so skip
+            # both the cleaning and copying the result back into the widget.
+            self.show_clean_status(self._last_output[1])
             return
 
+        if "\\" not in original_content:
+            # Without a single backslash there is nothing to unescape, so show the
+            # text as it is instead of digesting it and starting a cleaning thread.
+            self._apply_clean_result(input_hash, original_content, 0, None, None)
+            return
+
+        # Clean in a background thread so large documents don't freeze the window.
+        self._cleaning = True
+        self.clean_button.config(state="disabled")
+        self.set_status("Cleaning...")
+        threading.Thread(target=self._do_clean,
+                         args=(original_content, input_hash, self._last_output_lines),
+                         daemon=True).start()
+
+    def _do_clean(self, original_content, input_hash, old_lines):
+        """Runs in the background thread. Cleans the text and hands the result to the main thread."""
+        try:
+            cleaned_content, changes_made = self.clean_cached(original_content)
+            # Split the result into lines here too, keeping the main thread's work to a minimum.
+            opcodes = None
+            if len(cleaned_content) > LARGE_OUTPUT_CHARS:
+                lines = cleaned_content.split('\n') # For the output viewer.
+            else:
+                # Work out which lines of the text area changed, so that small edits
+                # only touch those lines (and keep the text area's scroll position).
+                lines = split_lines(cleaned_content)
+                if old_lines:
+                    matcher = difflib.SequenceMatcher(None, old_lines, lines)
+                    opcodes = [opcode for opcode in matcher.get_opcodes() if opcode[0] != 'equal']
+                    changed = sum(max(i2 - i1, j2 - j1) for _, i1, i2, j1, j2 in opcodes)
+                    if changed > len(lines) * MAX_PATCHED_FRACTION:
+                        opcodes = None # Too much changed: refilling the widget is quicker.
+        except Exception as e:
+            # Report the failure on the main thread, which also re-enables cleaning.
+            self.after(0, self._clean_failed, e)
+            return
+        # Widgets may only be updated from the main thread, so schedule the update there.
+        self.after(0, self._apply_clean_result, input_hash, cleaned_content, changes_made, lines, opcodes)
+
+    def clean_cached(self, original_content):
+        """Cleans text, reusing the result when the same text was cleaned recently."""
+        # surrogatepass: Tk can hand back lone surrogates (e.g. pasted emoji halves)
+        key = hashlib.blake2b(original_content.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+        result = self._clean_cache.get(key)
+        if result is not None:
+            self._clean_cache.move_to_end(key) # Mark it as the most recently used.
+            return result
+
         # Call the cleaner logic.
-        cleaned_content, changes_made = self.cleaner.clean_escaped_markdown(original_content)
+        result = self.cleaner.clean_escaped_markdown(original_content)
+        self._clean_cache[key] = result
+        if len(self._clean_cache) > CLEAN_CACHE_SIZE:
+            self._clean_cache.popitem(last=False) # Forget the least recently used result.
+        return result
+
+    def _apply_clean_result(self, input_hash, cleaned_content, changes_made, lines, opcodes):
+        """Shows the result of a background cleaning run and re-enables the 'Clean Text' button."""
+        self._last_input_hash = input_hash
+        self._last_output = (cleaned_content, changes_made)
+
+        self.show_output(cleaned_content, lines, opcodes)
 
-        # Update the output text area. It must be temporarily enabled to modify it.
-        self.output_text.config(state="normal")
-        self.output_text.delete("1.0", tk.END)
-        self.output_text.insert("1.0", cleaned_content)
-        self.output_text.config(state="disabled") # Disable it again to prevent user edits.
+        self.show_clean_status(changes_made)
+        self.clean_button.config(state="normal")
+        self._cleaning = False
 
-        # Provide feedback in the status bar.
+    def show_output(self, cleaned_content, lines=None, opcodes=None):
+        """
+        Shows cleaned text in the output area. Very large results go to a viewer that only
+        draws the visible lines; the rest to a wrapped text area whose text can be selected.
+        For the text area, lines are the result's split_lines and opcodes the changes from
+        the lines it shows now, if only part of it needs updating.
+        """
+        if len(cleaned_content) > LARGE_OUTPUT_CHARS:
+            if self.output_view is None:
+                self.output_view = VirtualTextView(self._output_frame, font=("Helvetica", 12))
+            # Only draws the lines in view, so this is quick for any size.
+            self.output_view.set_lines(lines if lines is not None else cleaned_content.split('\n'))
+            shown, hidden = self.output_view, self.output_text
+        else:
+            if self.output_text is None:
+                self.output_text = scrolledtext.ScrolledText(self._output_frame, wrap=tk.WORD, height=10, width=50, font=("Helvetica", 12), state="disabled", relief="solid", bd=1)
+                opcodes = None # Nothing to patch yet.
+            if lines is None:
+                lines = split_lines(cleaned_content)
+
+            # Update the output text area. It must be temporarily enabled to modify it.
+            if opcodes is not None:
+                self.output_text.config(state="normal")
+                # Patch from the bottom up, so the line numbers of earlier changes stay valid.
+                for _, i1, i2, j1, j2 in reversed(opcodes):
+                    if i2 > i1:
+                        self.output_text.delete(f"{i1 + 1}.0", f"{i2 + 1}.0")
+                    if j2 > j1:
+                        self.output_text.insert(f"{i1 + 1}.0", "".join(lines[j1:j2]))
+                self.output_text.config(state="disabled") # Disable it again to prevent user edits.
+            else:
+                # While the text is replaced the widget is taken out of the layout and
+                # word wrapping is turned off, so Tk doesn't lay out the whole document
+                # as it is inserted; it only wraps what is visible once shown again.
+                self.output_text.config(state="normal", wrap=tk.NONE)
+                self.output_text.pack_forget()
+                self.output_text.delete("1.0", tk.END)
+                self.output_text.insert("1.0", cleaned_content)
+                self.output_text.config(wrap=tk.WORD, state="disabled") # Disable it again to prevent user edits.
+            self._last_output_lines = lines
+            shown, hidden = self.output_text, self.output_view
+
+        # Swap the widgets if the last result was shown in the other one.
+        if hidden is not None:
+            hidden.pack_forget()
+        shown.pack(fill=tk.BOTH, expand=True)
+
+    def _clean_failed(self, error):
+        """Reports a background cleaning run that raised an error and re-enables the 'Clean Text' button."""
+        self.clean_button.config(state="normal")
+        self._cleaning = False
+        messagebox.showerror("Error", f"Failed to clean text: {error}")
+        self.set_status("Error cleaning text")
+
+    def show_clean_status(self, changes_made):
+        """Provides feedback in the status bar about the last cleaning run."""
         if changes_made > 0:
-            self.status_label.config(text=f"Successfully cleaned {changes_made} types of markdown patterns.")
+            self.set_status(f"Successfully cleaned {changes_made} types of markdown patterns.")
         else:
-            self.status_label.config(text="No escaped markdown patterns were found.")
+            self.set_status("No escaped markdown patterns were found.")
+
+    def get_cleaned_content(self):
+        """Returns the text shown in the output area."""
+        # The output area always shows the last cleaning result, so use the cached string.
+        if self._last_output is not None:
+            return self._last_output[0]
+        return "" # Nothing has been cleaned yet.
 
     def copy_to_clipboard(self):
         """Handles the 'Copy to Clipboard' button click."""
-        cleaned_content = self.output_text.get("1.0", tk.END)
+        cleaned_content = self.get_cleaned_content()
         if cleaned_content.strip():
             self.clipboard_clear()  # Clear the system clipboard.
             self.clipboard_append(cleaned_content) # Add the new content.
-            self.status_label.config(text="Cleaned text copied to clipboard!")
+            self.set_status("Cleaned text copied to clipboard!")
         else:
-            self.status_label.config(text="Nothing to copy.")
+            self.set_status("Nothing to copy.")
 
     def save_file(self):
         """Handles the 'Save As...' button click. Opens a save file dialog."""
-        cleaned_content = self.output_text.get("1.emacs", tk.END)
+        cleaned_content = self.get_cleaned_content()
         if not cleaned_content.strip():
-            self.status_label.config(text="Nothing to save.")
+            self.set_status("Nothing to save.")
             return
 
         # Ask the user where to save the file.
@@ -155,12 +601,15 @@ class MarkdownCleanerApp(tk.Tk):
             return
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(cleaned_content)
-            self.status_label.config(text=f"File saved to: {os.path.basename(file_path)}")
+            # Encode and write the text in slices, so it is never held as UTF-8 in full
+            # and writes skip the text layer's own buffering.
+            with open(file_path, 'wb') as file:
+                for start in range(0, len(cleaned_content), CHUNK_SIZE):
+                    file.write(cleaned_content[start:start + CHUNK_SIZE].encode('utf-8'))
+            self.set_status(f"File saved to: {os.path.basename(file_path)}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file: {e}")
-            self.status_label.config(text="Error saving file")
+            self.set_status("Error saving file")
 
 # --- Main Execution Block ---
 if __name__ == "__main__":